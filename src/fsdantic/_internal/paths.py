@@ -2,28 +2,15 @@
 
 from __future__ import annotations
 
+import functools
+import re
 
-def normalize_separators(path: str) -> str:
-    """Normalize all path separators to POSIX style."""
-    return path.replace("\\", "/")
+_SEPARATOR_RUNS = re.compile(r"[\\/]+")
 
 
-def collapse_duplicate_slashes(path: str) -> str:
-    """Collapse repeated path separators into single slashes."""
-    if not path:
-        return path
-
-    collapsed: list[str] = []
-    previous_was_slash = False
-    for char in path:
-        if char == "/":
-            if previous_was_slash:
-                continue
-            previous_was_slash = True
-        else:
-            previous_was_slash = False
-        collapsed.append(char)
-    return "".join(collapsed)
+def _normalize_separator_runs(path: str) -> str:
+    """Normalize separators and collapse duplicate slashes in one regex pass."""
+    return _SEPARATOR_RUNS.sub("/", path)
 
 
 def _cleanup_dot_segments(segments: list[str], *, absolute: bool) -> list[str]:
@@ -45,6 +32,7 @@ def _cleanup_dot_segments(segments: list[str], *, absolute: bool) -> list[str]:
     return cleaned
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_path(
     path: str,
     *,
@@ -60,7 +48,7 @@ def normalize_path(
     - Return absolute paths by default
     - Strip trailing slash except for root
     """
-    normalized = collapse_duplicate_slashes(normalize_separators(path.strip()))
+    normalized = _normalize_separator_runs(path.strip())
     is_absolute = normalized.startswith("/")
 
     if absolute:
@@ -92,13 +80,14 @@ def join_normalized_path(base: str, child: str) -> str:
     return normalize_path(f"{base.rstrip('/')}/{child}")
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_glob_pattern(pattern: str) -> str:
     """Normalize path-like parts of a glob pattern.
 
     Keeps wildcard tokens intact while applying separator normalization,
     duplicate slash collapse, and '.'/'..' cleanup.
     """
-    normalized = collapse_duplicate_slashes(normalize_separators(pattern.strip()))
+    normalized = _normalize_separator_runs(pattern.strip())
     if not normalized:
         return "*"
 
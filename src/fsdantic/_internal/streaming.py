@@ -11,8 +11,12 @@ async def hash_stream(
     *,
     algorithm: str = "sha256",
 ) -> str:
-    """Hash a byte stream incrementally and return the digest hex string."""
-    digest = hashlib.new(algorithm)
+    """Hash a byte stream incrementally and return the digest hex string.
+
+    Digests are used for change detection, not security, so the hash is
+    created with ``usedforsecurity=False`` (also keeps it usable under FIPS).
+    """
+    digest = hashlib.new(algorithm, usedforsecurity=False)
     async for chunk in stream:
         if chunk:
             digest.update(chunk)
@@ -23,28 +27,48 @@ async def compare_streams(
     left: AsyncIterator[bytes],
     right: AsyncIterator[bytes],
 ) -> bool:
-    """Compare two byte streams chunk-by-chunk."""
+    """Compare two byte streams chunk-by-chunk.
+
+    Chunk boundaries do not need to line up: each side keeps an offset into
+    its pending chunk, and the overlapping spans are compared in place.
+    ``bytes.startswith`` with a ``memoryview`` slice compares as a single
+    ``memcmp`` without copying the leftover buffer (``memoryview`` equality
+    compares item by item and is far slower).
+    """
     left_iter = left.__aiter__()
     right_iter = right.__aiter__()
+    left_chunk = right_chunk = b""
+    right_view = memoryview(right_chunk)
+    left_pos = right_pos = 0
+    left_done = right_done = False
 
     while True:
-        try:
-            left_chunk = await left_iter.__anext__()
-            left_done = False
-        except StopAsyncIteration:
-            left_chunk = b""
-            left_done = True
-
-        try:
-            right_chunk = await right_iter.__anext__()
-            right_done = False
-        except StopAsyncIteration:
-            right_chunk = b""
-            right_done = True
-
-        if left_done and right_done:
-            return True
-        if left_done != right_done:
-            return False
-        if left_chunk != right_chunk:
+        if left_pos == len(left_chunk) and not left_done:
+            try:
+                left_chunk = await left_iter.__anext__()
+                left_pos = 0
+            except StopAsyncIteration:
+                left_done = True
+        if right_pos == len(right_chunk) and not right_done:
+            try:
+                right_chunk = await right_iter.__anext__()
+                right_view = memoryview(right_chunk)
+                right_pos = 0
+            except StopAsyncIteration:
+                right_done = True
+
+        left_remaining = len(left_chunk) - left_pos
+        right_remaining = len(right_chunk) - right_pos
+        if not left_remaining or not right_remaining:
+            if (left_done and right_remaining) or (right_done and left_remaining):
+                return False
+            if left_done and right_done:
+                return True
+            # An empty chunk was yielded; pull again.
+            continue
+
+        size = min(left_remaining, right_remaining)
+        if not left_chunk.startswith(right_view[right_pos : right_pos + size], left_pos):
             return False
+        left_pos += size
+        right_pos += size
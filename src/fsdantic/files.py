@@ -3,10 +3,11 @@
 import asyncio
 import logging
 import codecs
+import functools
 import json
 import re
-from collections.abc import AsyncIterator
-from typing import Any, Literal, Optional, overload
+from collections.abc import AsyncIterator, Mapping
+from typing import Any, Literal, Optional, Self, overload
 
 from agentfs_sdk import AgentFS, ErrnoException
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
@@ -55,6 +56,7 @@ class FileQuery(BaseModel):
         return normalized
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _compile_glob_pattern(pattern: str) -> re.Pattern[str]:
         pieces: list[str] = ["^"]
         i = 0
@@ -87,6 +89,16 @@ class FileQuery(BaseModel):
         self._regex_matcher = re.compile(self.regex_pattern) if self.regex_pattern else None
         return self
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the query, validating the result when fields are updated.
+
+        ``BaseModel.model_copy`` skips validation, which would leave the copy
+        matching against the original pattern and accept invalid updates.
+        """
+        if update:
+            return type(self).model_validate({**self.model_dump(), **update})
+        return super().model_copy(deep=deep)
+
     def matches_path(self, path: str) -> bool:
         return bool(self._path_matcher.match(normalize_path(path)))
 
@@ -117,6 +129,16 @@ class FileManager:
     def __init__(self, agent_fs: AgentFS, base_fs: Optional[AgentFS] = None):
         self.agent_fs = agent_fs
         self.base_fs = base_fs
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._write_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_write_lock(self) -> asyncio.Lock:
+        # asyncio.Lock binds to the loop that first waits on it, so keep one per running loop.
+        loop = asyncio.get_running_loop()
+        if self._write_lock is None or self._write_lock_loop is not loop:
+            self._write_lock = asyncio.Lock()
+            self._write_lock_loop = loop
+        return self._write_lock
 
     @overload
     async def read(
@@ -245,13 +267,19 @@ class FileManager:
         ``content`` may be ``str``, ``bytes``, ``dict``, or ``list``.
         ``mode`` may be specified explicitly (``text``/``binary``/``json``) or inferred
         from content type.
+
+        AgentFS rejects concurrent file writes on one connection ("database is
+        locked"), so writes made through this ``FileManager`` are serialized.
+        Writes issued elsewhere (other managers, overlay merges, or direct
+        ``agent_fs.fs.write_file`` calls) are not coordinated with this lock.
         """
         path = normalize_path(path)
         payload = self._prepare_write_payload(content, mode=mode, encoding=encoding)
 
         context = f"FileManager.write(path={path!r})"
         try:
-            await self.agent_fs.fs.write_file(path, payload)
+            async with self._get_write_lock():
+                await self.agent_fs.fs.write_file(path, payload)
         except ErrnoException as e:
             raise translate_agentfs_error(e, context) from e
 
@@ -310,10 +338,12 @@ class FileManager:
     ) -> BatchResult:
         """Write multiple files with bounded concurrency and per-item outcomes.
 
-        ``concurrency_limit`` bounds fan-out using ``asyncio.Semaphore``. Results
-        preserve the original ``items`` ordering. Failed writes are reported per item
-        and do not cancel successful writes. Retry guidance: build a new batch from
-        items where ``ok`` is ``False``.
+        ``concurrency_limit`` bounds fan-out using ``asyncio.Semaphore``. Payload
+        preparation overlaps, but the AgentFS writes themselves are serialized by
+        this manager (see :meth:`write`). Results preserve the original ``items``
+        ordering. Failed writes are reported per item and do not cancel successful
+        writes. Retry guidance: build a new batch from items where ``ok`` is
+        ``False``.
         """
         if concurrency_limit <= 0:
             raise ValueError("concurrency_limit must be greater than 0")
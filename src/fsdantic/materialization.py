@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import shutil
 import uuid
 from dataclasses import dataclass
@@ -29,7 +31,7 @@ class ConflictResolution(str, Enum):
     ERROR = "error"  # Raise exception
 
 
-@dataclass
+@dataclass(slots=True)
 class FileChange:
     """Represents a change between base and overlay.
 
@@ -46,7 +48,7 @@ class FileChange:
     new_size: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileFingerprint:
     """Lightweight metadata snapshot for diff pre-checks."""
 
@@ -54,7 +56,7 @@ class FileFingerprint:
     mtime_ns: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MaterializationResult:
     """Result of materialization operation.
 
@@ -75,6 +77,45 @@ class MaterializationResult:
     errors: list[tuple[str, str]]  # (path, error_message)
 
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_PREALLOCATE_THRESHOLD = 128 * 1024
+_HAS_FALLOCATE = hasattr(os, "posix_fallocate")
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of ``data`` to ``fd``, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write a payload to ``path``, replacing any existing file."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_preallocated(path: str, data: bytes) -> None:
+    """Reserve the full payload with ``posix_fallocate`` before writing it.
+
+    Preallocation lets the filesystem lay the file out in one extent.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        try:
+            os.posix_fallocate(fd, 0, len(data))
+        except OSError:
+            # Preallocation is only a layout hint; unsupported filesystems
+            # (EOPNOTSUPP/EINVAL) still take the plain write below.
+            pass
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
 class Materializer:
     """Materialize AgentFS overlays to local filesystem.
 
@@ -141,6 +182,7 @@ class Materializer:
             target_path=target_path,
             allow_root=allow_root or self.allow_root,
         )
+
         staging_path = target_path.parent / f"{target_path.name}.tmp-{uuid.uuid4().hex}"
 
         stats = {
@@ -160,12 +202,15 @@ class Materializer:
             if not clean and target_path.exists():
                 shutil.copytree(target_path, staging_path, dirs_exist_ok=True)
 
+            # The copy loop works on plain strings to avoid per-file Path parsing.
+            staging_root = os.fspath(staging_path)
+
             # Materialize base layer first if provided
             if base_fs is not None:
-                await self._copy_recursive(base_fs, "/", staging_path, stats, changes, skipped, errors)
+                await self._copy_recursive(base_fs, "/", staging_root, stats, changes, skipped, errors)
 
             # Materialize overlay layer
-            await self._copy_recursive(agent_fs, "/", staging_path, stats, changes, skipped, errors, filters=filters)
+            await self._copy_recursive(agent_fs, "/", staging_root, stats, changes, skipped, errors, filters=filters)
 
             if not errors:
                 self._swap_staging_to_target(staging_path=staging_path, target_path=target_path)
@@ -290,8 +335,11 @@ class Materializer:
 
             # Hash-first comparison, then byte-accurate fallback on mismatch.
             try:
-                overlay_hash = await hash_stream(overlay_manager.read_stream(file_path))
-                base_hash = await hash_stream(base_manager.read_stream(file_path))
+                # Both sides are read-only streams, so hash them concurrently.
+                overlay_hash, base_hash = await asyncio.gather(
+                    hash_stream(overlay_manager.read_stream(file_path)),
+                    hash_stream(base_manager.read_stream(file_path)),
+                )
 
                 if overlay_hash != base_hash:
                     is_equal = await compare_streams(
@@ -319,7 +367,7 @@ class Materializer:
         self,
         source_fs: AgentFS,
         src_path: str,
-        dest_path: Path,
+        dest_path: str,
         stats: dict,
         changes: list[FileChange],
         skipped: list[str],
@@ -331,7 +379,7 @@ class Materializer:
         Args:
             source_fs: Source AgentFS filesystem
             src_path: Source path in AgentFS
-            dest_path: Destination path on disk
+            dest_path: Destination directory on disk (as a string)
             stats: Stats dictionary to update
             changes: List to append changes to
             skipped: List to append skipped files to
@@ -351,8 +399,12 @@ class Materializer:
             errors.append((src_path, str(e)))
             return
 
+        src_prefix = src_path.rstrip("/")
+        dest_prefix = dest_path + os.sep
+        check_conflicts = self.conflict_resolution != ConflictResolution.OVERWRITE
+
         for entry_name in entries:
-            entry_path = f"{src_path.rstrip('/')}/{entry_name}"
+            entry_path = f"{src_prefix}/{entry_name}"
 
             try:
                 # Get stats
@@ -360,8 +412,9 @@ class Materializer:
 
                 if stat.is_directory():
                     # Create directory and recurse
-                    local_dir = dest_path / entry_name
-                    local_dir.mkdir(exist_ok=True)
+                    local_dir = dest_prefix + entry_name
+                    if not os.path.isdir(local_dir):
+                        os.mkdir(local_dir)
                     await self._copy_recursive(
                         source_fs,
                         entry_path,
@@ -374,10 +427,11 @@ class Materializer:
                     )
                 elif stat.is_file():
                     # Copy file
-                    local_file = dest_path / entry_name
+                    local_file = dest_prefix + entry_name
 
-                    # Check if file exists and handle conflict
-                    if local_file.exists():
+                    # Check if file exists and handle conflict. OVERWRITE never
+                    # consults the result, so it skips the stat entirely.
+                    if check_conflicts and os.path.exists(local_file):
                         if self.conflict_resolution == ConflictResolution.SKIP:
                             skipped.append(entry_path)
                             continue
@@ -389,7 +443,10 @@ class Materializer:
                     content = await source_fs.fs.read_file(entry_path, encoding=None)
 
                     # Write to disk
-                    local_file.write_bytes(content)
+                    if _HAS_FALLOCATE and len(content) >= _PREALLOCATE_THRESHOLD:
+                        _write_preallocated(local_file, content)
+                    else:
+                        _write_file(local_file, content)
 
                     # Update stats
                     stats["files_written"] += 1
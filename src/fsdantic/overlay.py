@@ -2,9 +2,12 @@ from __future__ import annotations
 
 """High-level operations for AgentFS overlay filesystems."""
 
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Iterator
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Optional, Protocol
 
 from agentfs_sdk import AgentFS, ErrnoException
 
@@ -13,6 +16,14 @@ from ._internal.errors import translate_agentfs_error
 if TYPE_CHECKING:
     from .workspace import Workspace
 
+# Number of paths whose stats are fetched concurrently during merge and reset.
+# Only reads are fanned out: AgentFS rejects concurrent writes on one connection.
+_STAT_BATCH_SIZE = 16
+
+# Number of source file reads kept in flight ahead of the file being written
+# during merge, so target writes overlap with upcoming source reads.
+_MERGE_READ_AHEAD = 4
+
 
 class MergeStrategy(str, Enum):
     """Strategy for merging overlays."""
@@ -23,7 +34,7 @@ class MergeStrategy(str, Enum):
     CALLBACK = "callback"  # Use callback for conflicts
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeConflict:
     """Represents a merge conflict.
 
@@ -42,7 +53,7 @@ class MergeConflict:
     base_content: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeResult:
     """Result of merge operation.
 
@@ -186,46 +197,112 @@ class OverlayOperations:
             errors.append((path, str(e)))
             return
 
-        for entry_name in entries:
-            source_path = f"{path.rstrip('/')}/{entry_name}"
+        source_paths = [f"{path.rstrip('/')}/{entry_name}" for entry_name in entries]
+        source_stats: list[Any] = []
+        for start in range(0, len(source_paths), _STAT_BATCH_SIZE):
+            batch = source_paths[start : start + _STAT_BATCH_SIZE]
+            source_stats.extend(
+                await asyncio.gather(
+                    *(source.fs.stat(source_path) for source_path in batch),
+                    return_exceptions=True,
+                )
+            )
 
-            try:
-                # Get source stats
-                source_stat = await source.fs.stat(source_path)
-
-                # Check if directory
-                if source_stat.is_directory():
-                    # Ensure directory exists in target
-                    try:
-                        await target.fs.stat(source_path)
-                    except ErrnoException as e:
-                        if e.code != "ENOENT":
-                            context = f"OverlayOperations._merge_recursive(path={source_path!r})"
-                            raise translate_agentfs_error(e, context) from e
-                        # Directory doesn't exist, create it
-                        # Note: AgentFS mkdir creates parent dirs automatically
-                        await target.fs.mkdir(source_path.lstrip("/"))
-
-                    # Recurse
-                    await self._merge_recursive(
-                        source, target, source_path, strategy, stats, conflicts, errors
-                    )
-                    continue
-
-                # Handle file
-                if source_stat.is_file():
-                    await self._merge_file(
-                        source,
-                        target,
-                        source_path,
-                        strategy,
-                        stats,
-                        conflicts,
-                        errors,
-                    )
-
-            except (RuntimeError, TypeError, ValueError) as e:
-                errors.append((source_path, str(e)))
+        # Read ahead: keep the next few source file reads in flight while the
+        # current entry is written. Writes to target stay sequential.
+        file_paths = iter(
+            source_path
+            for source_path, source_stat in zip(source_paths, source_stats, strict=True)
+            if not isinstance(source_stat, BaseException) and source_stat.is_file()
+        )
+        reads: deque[tuple[str, asyncio.Future[bytes]]] = deque()
+
+        def schedule_reads() -> None:
+            while len(reads) < _MERGE_READ_AHEAD:
+                file_path = next(file_paths, None)
+                if file_path is None:
+                    return
+                reads.append(
+                    (file_path, asyncio.ensure_future(source.fs.read_file(file_path, encoding=None)))
+                )
+
+        try:
+            for source_path, source_stat in zip(source_paths, source_stats, strict=True):
+                schedule_reads()
+                source_read = None
+                if reads and reads[0][0] == source_path:
+                    source_read = reads.popleft()[1]
+                await self._merge_entry(
+                    source,
+                    target,
+                    source_path,
+                    source_stat,
+                    strategy,
+                    stats,
+                    conflicts,
+                    errors,
+                    source_read=source_read,
+                )
+        finally:
+            for _, pending in reads:
+                pending.cancel()
+            await asyncio.gather(*(pending for _, pending in reads), return_exceptions=True)
+
+    async def _merge_entry(
+        self,
+        source: AgentFS,
+        target: AgentFS,
+        source_path: str,
+        source_stat: Any,
+        strategy: MergeStrategy,
+        stats: dict,
+        conflicts: list[MergeConflict],
+        errors: list[tuple[str, str]],
+        source_read: Optional[Awaitable[bytes]] = None,
+    ) -> None:
+        """Merge one directory entry given its (possibly failed) source stat.
+
+        ``source_read`` is an already-started read of a file entry's content,
+        used instead of reading the source again.
+        """
+        try:
+            if isinstance(source_stat, BaseException):
+                raise source_stat
+
+            # Check if directory
+            if source_stat.is_directory():
+                # Ensure directory exists in target
+                try:
+                    await target.fs.stat(source_path)
+                except ErrnoException as e:
+                    if e.code != "ENOENT":
+                        context = f"OverlayOperations._merge_recursive(path={source_path!r})"
+                        raise translate_agentfs_error(e, context) from e
+                    # Directory doesn't exist, create it
+                    # Note: AgentFS mkdir creates parent dirs automatically
+                    await target.fs.mkdir(source_path.lstrip("/"))
+
+                # Recurse
+                await self._merge_recursive(
+                    source, target, source_path, strategy, stats, conflicts, errors
+                )
+                return
+
+            # Handle file
+            if source_stat.is_file():
+                await self._merge_file(
+                    source,
+                    target,
+                    source_path,
+                    strategy,
+                    stats,
+                    conflicts,
+                    errors,
+                    source_read=source_read,
+                )
+
+        except (RuntimeError, TypeError, ValueError) as e:
+            errors.append((source_path, str(e)))
 
     async def _merge_file(
         self,
@@ -236,24 +313,44 @@ class OverlayOperations:
         stats: dict,
         conflicts: list[MergeConflict],
         errors: list[tuple[str, str]],
+        source_read: Optional[Awaitable[bytes]] = None,
     ) -> None:
         """Merge a single file from source into target."""
+        if source_read is None:
+            source_read = source.fs.read_file(source_path, encoding=None)
         try:
-            source_content = await source.fs.read_file(source_path, encoding=None)
+            if strategy == MergeStrategy.OVERWRITE:
+                # Overlay always wins and conflicts are not reported, so the
+                # target copy never needs to be read or compared.
+                source_content = await source_read
+                target_exists = False
+                target_content = None
+            else:
+                # Read both sides concurrently; the target read doubles as the existence check
+                source_content, target_content = await asyncio.gather(
+                    source_read,
+                    target.fs.read_file(source_path, encoding=None),
+                    return_exceptions=True,
+                )
+                if isinstance(source_content, BaseException):
+                    raise source_content
 
-            # Check if file exists in target
-            target_exists = False
-            target_content = None
-            try:
-                target_content = await target.fs.read_file(source_path, encoding=None)
                 target_exists = True
-            except ErrnoException as e:
-                if e.code != "ENOENT":
-                    context = f"OverlayOperations._merge_file(path={source_path!r})"
-                    raise translate_agentfs_error(e, context) from e
+                if isinstance(target_content, ErrnoException):
+                    if target_content.code != "ENOENT":
+                        context = f"OverlayOperations._merge_file(path={source_path!r})"
+                        raise translate_agentfs_error(target_content, context) from target_content
+                    target_exists = False
+                    target_content = None
+                elif isinstance(target_content, BaseException):
+                    raise target_content
 
             # Handle conflict
             if target_exists and source_content != target_content:
+                if strategy == MergeStrategy.ERROR:
+                    errors.append((source_path, "Conflict detected"))
+                    return
+
                 conflict = MergeConflict(
                     path=source_path,
                     overlay_size=len(source_content),
@@ -261,10 +358,6 @@ class OverlayOperations:
                     overlay_content=source_content,
                     base_content=target_content or b"",
                 )
-
-                if strategy == MergeStrategy.ERROR:
-                    errors.append((source_path, "Conflict detected"))
-                    return
                 if strategy == MergeStrategy.PRESERVE:
                     # Keep target version
                     conflicts.append(conflict)
@@ -303,35 +396,76 @@ class OverlayOperations:
             >>> changes = await ops.list_changes(agent_fs)
             >>> print(f"Found {len(changes)} changed files")
         """
-        files = []
+        files: list[str] = []
+        async for batch in self.iter_changes(overlay, path):
+            files.extend(batch)
+        return files
+
+    async def iter_changes(
+        self, overlay: AgentFS, path: str = "/", batch_size: int = 128
+    ) -> AsyncIterator[list[str]]:
+        """Yield overlay file paths under ``path`` in batches.
+
+        Paths are produced in the same depth-first order as :meth:`list_changes`,
+        but callers can start consuming them before the whole tree is walked.
+
+        Args:
+            overlay: Overlay filesystem
+            path: Root path to check
+            batch_size: Maximum number of paths per yielded batch
+
+        Yields:
+            Non-empty lists of file paths in overlay
 
-        async def walk(current_path: str):
+        Examples:
+            >>> async for batch in ops.iter_changes(agent_fs):
+            ...     print(f"Found {len(batch)} changed files")
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+
+        batch: list[str] = []
+        stack: list[tuple[str, Iterator[str]]] = [
+            (path, iter(await self._readdir_changes(overlay, path)))
+        ]
+        while stack:
+            current_path, entries = stack[-1]
+            entry_name = next(entries, None)
+            if entry_name is None:
+                stack.pop()
+                continue
+
+            full_path = f"{current_path.rstrip('/')}/{entry_name}"
             try:
-                entries = await overlay.fs.readdir(current_path)
-                for entry_name in entries:
-                    full_path = f"{current_path.rstrip('/')}/{entry_name}"
-
-                    try:
-                        stat = await overlay.fs.stat(full_path)
-
-                        if stat.is_directory():
-                            await walk(full_path)
-                        else:
-                            files.append(full_path)
-                    except ErrnoException as e:
-                        if e.code != "ENOENT":
-                            context = f"OverlayOperations.list_changes(path={full_path!r})"
-                            raise translate_agentfs_error(e, context) from e
-                        pass
+                stat = await overlay.fs.stat(full_path)
             except ErrnoException as e:
-                if e.code == "ENOENT":
-                    pass
-                else:
-                    context = f"OverlayOperations.list_changes(path={current_path!r})"
+                if e.code != "ENOENT":
+                    context = f"OverlayOperations.list_changes(path={full_path!r})"
                     raise translate_agentfs_error(e, context) from e
+                continue
 
-        await walk(path)
-        return files
+            if stat.is_directory():
+                stack.append((full_path, iter(await self._readdir_changes(overlay, full_path))))
+                continue
+
+            batch.append(full_path)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    @staticmethod
+    async def _readdir_changes(overlay: AgentFS, path: str) -> list[str]:
+        """List directory entries for change walks, treating missing paths as empty."""
+        try:
+            return await overlay.fs.readdir(path)
+        except ErrnoException as e:
+            if e.code == "ENOENT":
+                return []
+            context = f"OverlayOperations.list_changes(path={path!r})"
+            raise translate_agentfs_error(e, context) from e
 
     async def reset_overlay(
         self, overlay: AgentFS, paths: Optional[list[str]] = None
@@ -358,24 +492,33 @@ class OverlayOperations:
 
         removed = 0
         errors: list[tuple[str, str]] = []
-        for path in paths:
-            normalized_path = path.lstrip("/")
-            try:
-                stat = await overlay.fs.stat(path)
-
-                if stat.is_directory():
-                    await overlay.fs.rm(normalized_path, recursive=True)
-                else:
-                    await overlay.fs.unlink(normalized_path)
-
-                removed += 1
-            except ErrnoException as e:
-                if e.code == "ENOENT":
-                    continue
-                context = f"OverlayOperations.reset_overlay(path={path!r})"
-                errors.append((path, str(translate_agentfs_error(e, context))))
-            except (RuntimeError, TypeError, ValueError) as e:
-                errors.append((path, str(e)))
+        for start in range(0, len(paths), _STAT_BATCH_SIZE):
+            batch = paths[start : start + _STAT_BATCH_SIZE]
+            batch_stats = await asyncio.gather(
+                *(overlay.fs.stat(path) for path in batch),
+                return_exceptions=True,
+            )
+            for path, stat in zip(batch, batch_stats, strict=True):
+                normalized_path = path.lstrip("/")
+                try:
+                    if isinstance(stat, BaseException):
+                        raise stat
+
+                    # Removals stay sequential; a path may already be gone if an
+                    # earlier entry removed its parent directory.
+                    if stat.is_directory():
+                        await overlay.fs.rm(normalized_path, recursive=True)
+                    else:
+                        await overlay.fs.unlink(normalized_path)
+
+                    removed += 1
+                except ErrnoException as e:
+                    if e.code == "ENOENT":
+                        continue
+                    context = f"OverlayOperations.reset_overlay(path={path!r})"
+                    errors.append((path, str(translate_agentfs_error(e, context))))
+                except (RuntimeError, TypeError, ValueError) as e:
+                    errors.append((path, str(e)))
 
         if errors:
             error_summary = "; ".join(
@@ -424,6 +567,10 @@ class OverlayManager:
         """List changed files currently present in this workspace overlay."""
         return await self._operations.list_changes(self._agent_fs, path=path)
 
+    def iter_changes(self, path: str = "/", batch_size: int = 128) -> AsyncIterator[list[str]]:
+        """Yield changed files currently present in this workspace overlay in batches."""
+        return self._operations.iter_changes(self._agent_fs, path=path, batch_size=batch_size)
+
     async def reset(self, paths: Optional[list[str]] = None) -> int:
         """Reset selected paths (or all paths) in this workspace overlay."""
         return await self._operations.reset_overlay(self._agent_fs, paths=paths)
@@ -1,5 +1,6 @@
 """Generic repository pattern for AgentFS KV operations."""
 
+from collections.abc import Mapping
 from typing import Any, Callable, Generic, Optional, Type, TypeVar
 
 from agentfs_sdk import AgentFS
@@ -172,13 +173,25 @@ class TypedKVRepository(Generic[T]):
         """Alias for save with explicit optimistic concurrency semantics."""
         await self.save(id, record, expected_version=expected_version, etag=etag)
 
-    async def load(self, id: str, model_type: Optional[Type[T]] = None) -> Optional[T]:
+    async def load(
+        self,
+        id: str,
+        model_type: Optional[Type[T]] = None,
+        *,
+        validate: bool = True,
+    ) -> Optional[T]:
         """Load a record from KV store.
 
         Args:
             id: Record identifier
             model_type: Optional Pydantic model class. If omitted, uses the
                 repository default `model_type` configured at construction.
+            validate: When False, build the model with ``model_construct`` and
+                skip validation. Only safe for trusted records whose stored
+                values already match the field types (no coercion of nested
+                models, datetimes, or enums is performed). Stored values that
+                are not mappings are still validated, so they raise
+                ``ValidationError`` as with ``validate=True``.
 
         Returns:
             Model instance or None if not found
@@ -193,7 +206,10 @@ class TypedKVRepository(Generic[T]):
         if data is None:
             return None
         # AgentFS KV store returns dict, not JSON string
-        return self._resolve_model_type(model_type).model_validate(data)
+        resolved_model_type = self._resolve_model_type(model_type)
+        if not validate and isinstance(data, Mapping):
+            return resolved_model_type.model_construct(**data)
+        return resolved_model_type.model_validate(data)
 
     async def delete(self, id: str) -> None:
         """Delete a record from KV store.
@@ -207,12 +223,21 @@ class TypedKVRepository(Generic[T]):
         key = self.key_builder(id)
         await self._manager.delete(key)
 
-    async def list_all(self, model_type: Optional[Type[T]] = None) -> list[T]:
+    async def list_all(
+        self,
+        model_type: Optional[Type[T]] = None,
+        *,
+        validate: bool = True,
+    ) -> list[T]:
         """List all records with the configured prefix.
 
         Args:
             model_type: Optional Pydantic model class. If omitted, uses the
                 repository default `model_type` configured at construction.
+            validate: When False, build models with ``model_construct`` and
+                skip validation (see :meth:`load`). Invalid records are then
+                returned rather than skipped, except values that are not
+                mappings, which are always skipped.
 
         Returns:
             List of all matching records
@@ -227,6 +252,13 @@ class TypedKVRepository(Generic[T]):
         records: list[T] = []
         resolved_model_type = self._resolve_model_type(model_type)
 
+        if not validate:
+            return [
+                resolved_model_type.model_construct(**item["value"])
+                for item in items
+                if isinstance(item["value"], Mapping)
+            ]
+
         for item in items:
             try:
                 records.append(resolved_model_type.model_validate(item["value"]))
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 class Workspace:
     """Unified runtime façade around an AgentFS instance."""
 
+    __slots__ = ("_raw", "_files", "_kv", "_overlay", "_materialize", "_closed", "__weakref__")
+
     def __init__(self, raw: AgentFS):
         self._raw = raw
         self._files: FileManager | None = None
@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures for fsdantic tests."""
 
+import asyncio
 import os
 import tempfile
 from datetime import datetime
@@ -8,6 +9,20 @@ from typing import AsyncGenerator
 import pytest
 from agentfs_sdk import AgentFS, AgentFSOptions as SDKAgentFSOptions
 
+from fsdantic import FileManager
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional
+    uvloop = None
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed."""
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
 
 @pytest.fixture
 def sample_file_content():
@@ -52,6 +67,76 @@ async def stable_fs():
             await stable._db.close()
 
 
+@pytest.fixture
+def ops(agent_fs):
+    """Provide a FileManager over the overlay AgentFS only."""
+    return FileManager(agent_fs)
+
+
+@pytest.fixture
+def stable_ops(stable_fs):
+    """Provide a FileManager over the stable/base AgentFS only."""
+    return FileManager(stable_fs)
+
+
+@pytest.fixture
+def layered_ops(agent_fs, stable_fs):
+    """Provide a FileManager over the overlay with base-layer fallthrough."""
+    return FileManager(agent_fs, base_fs=stable_fs)
+
+
+@pytest.fixture(scope="module")
+async def prepopulated_layers():
+    """Provide (overlay, base) AgentFS layers populated once per module.
+
+    Tests using these layers must treat them as read-only.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        overlay = await AgentFS.open(SDKAgentFSOptions(path=os.path.join(tmpdir, "overlay.db")))
+        base = await AgentFS.open(SDKAgentFSOptions(path=os.path.join(tmpdir, "base.db")))
+        try:
+            await base.fs.write_file("/base.txt", "base content")
+            await base.fs.write_file("/base-only.txt", "base content")
+            await base.fs.write_file("/test.txt", "base content")
+            await base.fs.write_file("/file.txt", "short")
+            await overlay.fs.write_file("/overlay.txt", "overlay")
+            await overlay.fs.write_file("/test.txt", "overlay content")
+            await overlay.fs.write_file("/file.txt", "much longer content")
+            yield overlay, base
+        finally:
+            await overlay._db.close()
+            await base._db.close()
+
+
+@pytest.fixture
+def prepopulated_ops(prepopulated_layers):
+    """Provide a FileManager over the shared prepopulated layers."""
+    overlay, base = prepopulated_layers
+    return FileManager(overlay, base_fs=base)
+
+
+@pytest.fixture(scope="module")
+async def tree_ops():
+    """Provide a FileManager over a nested tree populated once per module.
+
+    Tests using this tree must treat it as read-only.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        agent = await AgentFS.open(SDKAgentFSOptions(path=os.path.join(tmpdir, "tree.db")))
+        try:
+            for path in (
+                "/file1.txt",
+                "/dir1/file2.txt",
+                "/dir1/file3.txt",
+                "/dir1/subdir/file4.txt",
+                "/level1/level2/level3/file.txt",
+            ):
+                await agent.fs.write_file(path, "content")
+            yield FileManager(agent)
+        finally:
+            await agent._db.close()
+
+
 @pytest.fixture
 async def agent_with_files(agent_fs):
     """Provide AgentFS with sample files already created."""
@@ -83,12 +168,18 @@ def sample_records():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_file_content():
     """Generate large file content for testing."""
     return "x" * (10 * 1024 * 1024)  # 10MB
 
 
+@pytest.fixture(scope="session")
+def large_bytes():
+    """Provide a shared 1MB binary payload."""
+    return b"x" * (1024 * 1024)
+
+
 @pytest.fixture
 def temp_workspace_dir():
     """Provide a temporary workspace directory for materialization."""
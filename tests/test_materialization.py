@@ -392,6 +392,42 @@ class TestMaterializerEdgeCases:
         assert result.files_written == 0
         assert target.exists()
 
+    async def test_empty_filesystem_clean_clears_existing_target(self, agent_fs, temp_workspace_dir):
+        """Empty layers should still replace existing target contents when clean=True."""
+        target = Path(temp_workspace_dir) / "empty_clean"
+        target.mkdir(parents=True)
+        (target / "stale.txt").write_text("stale")
+
+        result = await Materializer().materialize(agent_fs, target, clean=True)
+
+        assert result.files_written == 0
+        assert not result.errors
+        assert target.exists()
+        assert list(target.iterdir()) == []
+
+    async def test_empty_filesystem_without_clean_preserves_target(self, agent_fs, temp_workspace_dir):
+        """Empty layers should leave existing target contents untouched when clean=False."""
+        target = Path(temp_workspace_dir) / "empty_no_clean"
+        target.mkdir(parents=True)
+        (target / "existing.txt").write_text("existing")
+
+        result = await Materializer().materialize(agent_fs, target, clean=False)
+
+        assert result.files_written == 0
+        assert not result.errors
+        assert (target / "existing.txt").read_text() == "existing"
+
+    async def test_layer_with_only_empty_directory(self, agent_fs, temp_workspace_dir):
+        """A layer holding only an empty directory should still materialize it."""
+        await agent_fs.fs.mkdir("/empty_dir")
+        target = Path(temp_workspace_dir) / "only_dir"
+
+        result = await Materializer().materialize(agent_fs, target)
+
+        assert result.files_written == 0
+        assert not result.errors
+        assert (target / "empty_dir").is_dir()
+
     async def test_binary_files(self, agent_fs, temp_workspace_dir):
         """Should handle binary files correctly."""
         binary_content = bytes(range(256))
@@ -418,6 +454,19 @@ class TestMaterializerEdgeCases:
         assert (target / "large.txt").exists()
         assert len((target / "large.txt").read_text()) == len(large_content)
 
+    @pytest.mark.parametrize("size", [0, 4096, 128 * 1024 - 1, 128 * 1024])
+    async def test_writer_preallocation_boundary(self, agent_fs, temp_workspace_dir, size):
+        """Plain and preallocated writes should reproduce payloads byte-for-byte."""
+        payload = bytes(i % 251 for i in range(size))
+        await agent_fs.fs.write_file("/sized.bin", payload)
+
+        target = Path(temp_workspace_dir) / f"sized-{size}"
+        result = await Materializer().materialize(agent_fs, target)
+
+        assert not result.errors
+        assert result.bytes_written == size
+        assert (target / "sized.bin").read_bytes() == payload
+
     async def test_many_files(self, agent_fs, temp_workspace_dir):
         """Should handle many files efficiently."""
         # Create 100 files
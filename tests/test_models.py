@@ -3,6 +3,8 @@
 from datetime import datetime, timedelta
 
 import pytest
+from pydantic import ValidationError
+
 from fsdantic import (
     AgentFSOptions,
     FileEntry,
@@ -246,6 +248,28 @@ def test_view_query_rejects_min_size_greater_than_max_size():
         ViewQuery(min_size=100, max_size=10)
 
 
+def test_view_query_copy_recompiles_matchers():
+    """Test model_copy refreshes the compiled path and regex matchers."""
+    query = ViewQuery(path_pattern="*.py")
+    copied = query.model_copy(update={"path_pattern": "*.md", "regex_pattern": "docs/"})
+
+    assert isinstance(copied, ViewQuery)
+    assert copied.matches_path("/docs/readme.md") is True
+    assert copied.matches_path("/docs/main.py") is False
+    assert copied.matches_regex("/src/readme.md") is False
+    assert query.matches_path("/docs/main.py") is True
+
+
+def test_view_query_copy_validates_updates():
+    """Test model_copy rejects invalid updates with ValidationError."""
+    query = ViewQuery(path_pattern="*.py", max_size=10)
+
+    with pytest.raises(ValidationError):
+        query.model_copy(update={"path_pattern": 5})
+    with pytest.raises(ValidationError, match="min_size must be less than or equal to max_size"):
+        query.model_copy(update={"min_size": 100})
+
+
 def test_view_query_pattern_matching_corner_cases():
     """Test ViewQuery pattern matching across basename and recursive patterns."""
     query = ViewQuery(path_pattern="*.py")
@@ -263,6 +287,15 @@ def test_view_query_pattern_matching_corner_cases():
     assert recursive_query.matches_path("/data/a.json") is True
 
 
+def test_view_query_equal_patterns_share_compiled_matcher():
+    """Test equal glob patterns reuse one compiled matcher."""
+    first = ViewQuery(path_pattern="*.py")
+    second = ViewQuery(path_pattern="./*.py")
+
+    assert first._path_matcher is second._path_matcher
+    assert ViewQuery(path_pattern="*.txt")._path_matcher is not first._path_matcher
+
+
 def test_view_query_regex_matcher_optional_and_compiled():
     """Test regex matcher behavior with and without regex_pattern."""
     no_regex = ViewQuery()
@@ -1,6 +1,7 @@
 """Tests for FileManager helper class."""
 
 import asyncio
+import re
 
 import pytest
 from agentfs_sdk import ErrnoException
@@ -18,58 +19,78 @@ from fsdantic import (
 )
 
 
-@pytest.mark.asyncio
-class TestFileManager:
-    """Test FileManager basic functionality."""
+_STAT_BYTES = b"test content"
+_BASE_BYTES = b"base content"
+_OVERLAY_BYTES = b"much longer content"
 
-    async def test_write_and_read_file(self, agent_fs):
-        """Should write and read files correctly."""
-        ops = FileManager(agent_fs)
+_EMPTY_TREE = {"name": "/", "path": "/", "type": "directory", "children": []}
+_EXPECTED_QUERY_PATHS = frozenset({"/alpha/beta/file.txt", "/alpha/beta/other.py"})
 
-        await ops.write("/test.txt", "Hello, World!")
-        content = await ops.read("/test.txt")
+_RE_CHUNK_SIZE = re.compile(r"chunk_size must be greater than 0")
+_RE_BINARY_MODE = re.compile(r"mode='binary' requires bytes content")
+_RE_TEXT_MODE = re.compile(r"mode='text' requires str content")
+_RE_JSON_MODE = re.compile(r"mode='json' requires dict or list content")
+_RE_UNKNOWN_ENCODING = re.compile(r"Unknown encoding")
+_RE_BINARY_ENCODING = re.compile(r"encoding must be None when mode='binary'")
+_RE_TEXT_ENCODING = re.compile(r"encoding must be provided when mode='text'")
 
-        assert content == "Hello, World!"
+_DICT_PAYLOAD = {"message": "こんにちは", "count": 2}
+_DICT_EXPECTED = '{\n  "message": "こんにちは",\n  "count": 2\n}'
+_LIST_PAYLOAD = ["α", "β", 3]
+_LIST_EXPECTED = '[\n  "α",\n  "β",\n  3\n]'
+
+
+def _names(node):
+    """Return the names of a tree node's children in order."""
+    return [child["name"] for child in node["children"]]
 
-    async def test_write_bytes(self, agent_fs):
-        """Should handle binary content."""
-        ops = FileManager(agent_fs)
 
+@pytest.mark.asyncio
+class TestFileManager:
+    """Test FileManager basic functionality."""
+
+    async def test_write_bytes(self, ops):
+        """Should handle binary content."""
         binary_content = b"\x00\x01\x02\x03"
         await ops.write("/binary.dat", binary_content)
 
         content = await ops.read("/binary.dat", mode="binary")
         assert content == binary_content
 
-    async def test_read_with_encoding(self, agent_fs):
-        """Should decode with specified encoding."""
-        ops = FileManager(agent_fs)
-
-        await ops.write("/utf8.txt", "Hello! 你好", encoding="utf-8")
-        content = await ops.read("/utf8.txt", encoding="utf-8")
-
-        assert content == "Hello! 你好"
-
-    async def test_file_exists(self, agent_fs):
+    @pytest.mark.parametrize(
+        ("content", "encoding"),
+        [
+            ("Hello, World!", "utf-8"),
+            ("Hello 世界 🌍 مرحبا мир", "utf-8"),
+            ("Hello! 你好", "utf-8"),
+            ("caf\xe9", "latin-1"),
+        ],
+        ids=["ascii", "unicode", "utf-8", "latin-1"],
+    )
+    async def test_text_roundtrip(self, ops, content, encoding):
+        """Should encode and decode text with the specified encoding."""
+        await ops.write("/text.txt", content, encoding=encoding)
+
+        assert await ops.read("/text.txt", encoding=encoding) == content
+
+    @pytest.mark.parametrize("created", [False, True], ids=["missing", "created"])
+    async def test_file_exists(self, ops, created):
         """Should check file existence correctly."""
-        ops = FileManager(agent_fs)
+        if created:
+            await ops.write("/test.txt", "content")
 
-        # Initially doesn't exist
-        assert await ops.exists("/test.txt") is False
+        assert await ops.exists("/test.txt") is created
 
-        # Create it
-        await ops.write("/test.txt", "content")
-
-        # Now it exists
-        assert await ops.exists("/test.txt") is True
-
-    async def test_list_dir(self, agent_fs):
+    async def test_list_dir(self, ops):
         """Should list directory contents with deterministic ordering."""
-        ops = FileManager(agent_fs)
-
-        await ops.write("/dir/file-b.txt", "content1")
-        await ops.write("/dir/file-a.txt", "content2")
-        await ops.write("/dir/file-c.txt", "content3")
+        write_result = await ops.write_many(
+            [
+                ("/dir/file-b.txt", "content1"),
+                ("/dir/file-a.txt", "content2"),
+                ("/dir/file-c.txt", "content3"),
+            ],
+        )
+        assert all(item.ok for item in write_result.items)
 
         assert await ops.list_dir("/dir") == ["file-a.txt", "file-b.txt", "file-c.txt"]
         assert await ops.list_dir("/dir", output="relative") == [
@@ -83,137 +104,110 @@ class TestFileManager:
             "/dir/file-c.txt",
         ]
 
-    async def test_search_files_with_pattern(self, agent_fs):
+    async def test_search_files_with_pattern(self, ops):
         """Should search files by glob pattern."""
-        ops = FileManager(agent_fs)
-
         # Create files
-        await ops.write("/file1.py", "print('1')")
-        await ops.write("/file2.py", "print('2')")
-        await ops.write("/file3.txt", "text")
-        await ops.write("/data/file4.py", "print('4')")
+        write_result = await ops.write_many(
+            [
+                ("/file1.py", "print('1')"),
+                ("/file2.py", "print('2')"),
+                ("/file3.txt", "text"),
+                ("/data/file4.py", "print('4')"),
+            ],
+        )
+        assert all(item.ok for item in write_result.items)
 
         # Search for Python files
         py_files = await ops.search("*.py", recursive=True)
 
-        assert len(py_files) == 3
-        assert "/file1.py" in py_files
-        assert "/file2.py" in py_files
-        assert "/data/file4.py" in py_files
+        assert set(py_files) == {"/file1.py", "/file2.py", "/data/file4.py"}
 
-    async def test_search_files_non_recursive(self, agent_fs):
+    async def test_search_files_non_recursive(self, ops):
         """Should respect recursive parameter."""
-        ops = FileManager(agent_fs)
-
-        await ops.write("/file1.txt", "content")
-        await ops.write("/data/file2.txt", "content")
+        write_result = await ops.write_many([("/file1.txt", "content"), ("/data/file2.txt", "content")])
+        assert all(item.ok for item in write_result.items)
 
         # Non-recursive should only find root level
         files = await ops.search("*.txt", recursive=False)
 
-        assert len(files) == 1
-        assert "/file1.txt" in files
+        assert set(files) == {"/file1.txt"}
 
-    async def test_stat(self, agent_fs):
+    async def test_stat(self, ops):
         """Should get file statistics."""
-        ops = FileManager(agent_fs)
-
-        content = "test content"
-        await ops.write("/test.txt", content)
+        await ops.write("/test.txt", _STAT_BYTES)
 
         stats = await ops.stat("/test.txt")
 
         assert isinstance(stats, FileStats)
-        assert stats.size == len(content.encode("utf-8"))
+        assert stats.size == len(_STAT_BYTES)
         assert stats.is_file
         assert not stats.is_dir()
 
-    async def test_remove(self, agent_fs):
+    async def test_remove(self, ops):
         """Should remove files."""
-        ops = FileManager(agent_fs)
-
         await ops.write("/to-delete.txt", "content")
-        assert await ops.exists("/to-delete.txt")
-
         await ops.remove("/to-delete.txt")
         assert not await ops.exists("/to-delete.txt")
 
-    async def test_remove_directory_non_recursive_fails_when_not_empty(self, agent_fs):
+    async def test_remove_directory_non_recursive_fails_when_not_empty(self, ops):
         """Should fail predictably for non-empty directories when recursive=False."""
-        ops = FileManager(agent_fs)
-
         await ops.write("/dir/file.txt", "content")
 
         with pytest.raises(DirectoryNotEmptyError):
             await ops.remove("/dir", recursive=False)
 
-    async def test_remove_directory_recursive(self, agent_fs):
+    async def test_remove_directory_recursive(self, ops):
         """Should remove directories recursively when requested."""
-        ops = FileManager(agent_fs)
-
         await ops.write("/dir/sub/file.txt", "content")
         await ops.remove("/dir", recursive=True)
 
         assert await ops.exists("/dir/sub/file.txt") is False
 
-    async def test_tree_structure(self, agent_fs):
+    @pytest.mark.xdist_group(name="tree_ops")
+    async def test_tree_structure(self, tree_ops):
         """Should generate directory tree with stable schema and ordering."""
-        ops = FileManager(agent_fs)
-
-        await ops.write("/file1.txt", "content")
-        await ops.write("/dir1/file2.txt", "content")
-        await ops.write("/dir1/file3.txt", "content")
-        await ops.write("/dir1/subdir/file4.txt", "content")
-
-        tree = await ops.tree("/")
+        tree = await tree_ops.tree("/")
 
         assert tree["type"] == "directory"
         assert tree["path"] == "/"
-        assert [child["name"] for child in tree["children"]] == ["dir1", "file1.txt"]
+        assert _names(tree) == ["dir1", "level1", "file1.txt"]
 
         dir1 = tree["children"][0]
         assert dir1["type"] == "directory"
-        assert [child["name"] for child in dir1["children"]] == ["subdir", "file2.txt", "file3.txt"]
+        assert _names(dir1) == ["subdir", "file2.txt", "file3.txt"]
 
-    async def test_methods_normalize_paths(self, agent_fs):
+    async def test_methods_normalize_paths(self, ops):
         """Path-accepting methods should normalize input paths."""
-        ops = FileManager(agent_fs)
-
         await ops.write("nested//./dir/../dir/file.txt", "normalized")
 
-        assert await ops.exists("nested/dir/file.txt") is True
-        assert await ops.read("/nested/dir/./file.txt") == "normalized"
+        exists, content, stats, listed = await asyncio.gather(
+            ops.exists("nested/dir/file.txt"),
+            ops.read("/nested/dir/./file.txt"),
+            ops.stat("nested/dir/file.txt"),
+            ops.list_dir("nested//dir//"),
+        )
 
-        stats = await ops.stat("nested/dir/file.txt")
+        assert exists is True
+        assert content == "normalized"
         assert stats.is_file is True
-
-        listed = await ops.list_dir("nested//dir//")
         assert "file.txt" in listed
 
         await ops.remove("nested/dir/./file.txt")
         assert await ops.exists("/nested/dir/file.txt") is False
 
-    async def test_search_and_query_return_normalized_paths(self, agent_fs):
+    async def test_search_and_query_return_normalized_paths(self, ops):
         """Search/query output paths should be consistently normalized."""
-        ops = FileManager(agent_fs)
-
         await ops.write("/alpha//beta/./file.txt", "x")
         await ops.write("/alpha/beta/../beta/other.py", "print('x')")
 
         txt = await ops.search("alpha//**/*.txt")
         assert txt == ["/alpha/beta/file.txt"]
 
-        from fsdantic import ViewQuery
-
         entries = await ops.query(ViewQuery(path_pattern="alpha//**/*"))
-        assert {entry.path for entry in entries} == {
-            "/alpha/beta/file.txt",
-            "/alpha/beta/other.py",
-        }
+        assert frozenset(entry.path for entry in entries) == _EXPECTED_QUERY_PATHS
 
-    async def test_read_many_preserves_order_and_reports_partial_failures(self, agent_fs):
+    async def test_read_many_preserves_order_and_reports_partial_failures(self, ops):
         """read_many should preserve order and report per-item failures."""
-        ops = FileManager(agent_fs)
         await ops.write("/present-a.txt", "a")
         await ops.write("/present-b.txt", "b")
 
@@ -226,10 +220,8 @@ class TestFileManager:
         assert result.items[1].error is not None
         assert result.items[2].value == "b"
 
-    async def test_write_many_enforces_concurrency_limit(self, agent_fs, monkeypatch):
+    async def test_write_many_enforces_concurrency_limit(self, ops, monkeypatch):
         """write_many should never exceed its concurrency limit."""
-        ops = FileManager(agent_fs)
-
         active = 0
         max_active = 0
 
@@ -248,19 +240,26 @@ class TestFileManager:
         assert all(item.ok for item in result.items)
         assert max_active <= 3
 
-    async def test_tree_with_max_depth(self, agent_fs):
-        """Should respect max_depth parameter."""
-        ops = FileManager(agent_fs)
+    async def test_write_many_concurrent_batch_persists_every_file(self, ops):
+        """write_many should not surface AgentFS write-lock contention as failures."""
+        payload = [(f"/many/file-{i}.txt", f"value-{i}") for i in range(40)]
+        result = await ops.write_many(payload, concurrency_limit=8)
 
-        await ops.write("/level1/level2/level3/file.txt", "content")
+        assert [item.ok for item in result.items] == [True] * 40
+        contents = await asyncio.gather(*(ops.read(path) for path, _ in payload))
+        assert contents == [content for _, content in payload]
 
-        tree = await ops.tree("/", max_depth=1)
-        assert tree["children"][0]["name"] == "level1"
+    @pytest.mark.xdist_group(name="tree_ops")
+    async def test_tree_with_max_depth(self, tree_ops):
+        """Should respect max_depth parameter."""
+        tree = await tree_ops.tree("/", max_depth=1)
+
+        assert _names(tree) == ["dir1", "level1", "file1.txt"]
         assert tree["children"][0]["children"] == []
+        assert tree["children"][1]["children"] == []
 
-    async def test_read_stream_chunk_boundaries_and_parity(self, agent_fs):
+    async def test_read_stream_chunk_boundaries_and_parity(self, ops):
         """read_stream should yield stable chunk boundaries and exact bytes parity."""
-        ops = FileManager(agent_fs)
         payload = b"abcdefghijkl"
         await ops.write("/chunked.bin", payload, mode="binary")
 
@@ -270,215 +269,155 @@ class TestFileManager:
         assert b"".join(chunks) == payload
         assert b"".join([c async for c in ops.read_stream("/chunked.bin", chunk_size=64)]) == payload
 
-    async def test_read_stream_falls_back_to_base_layer(self, agent_fs, stable_fs):
+    async def test_read_stream_falls_back_to_base_layer(self, stable_fs, layered_ops):
         """read_stream should support overlay->base ENOENT fallback via read()."""
-        ops = FileManager(agent_fs, base_fs=stable_fs)
         await stable_fs.fs.write_file("/base-only.bin", b"base-bytes")
 
-        streamed = b"".join([chunk async for chunk in ops.read_stream("/base-only.bin", chunk_size=3)])
+        streamed = b"".join([chunk async for chunk in layered_ops.read_stream("/base-only.bin", chunk_size=3)])
 
         assert streamed == b"base-bytes"
 
-    async def test_read_stream_rejects_invalid_chunk_size(self, agent_fs):
+    async def test_read_stream_rejects_invalid_chunk_size(self, ops):
         """read_stream should validate chunk size."""
-        ops = FileManager(agent_fs)
         await ops.write("/value.bin", b"x", mode="binary")
 
-        with pytest.raises(ValueError, match="chunk_size must be greater than 0"):
+        with pytest.raises(ValueError, match=_RE_CHUNK_SIZE):
             _ = [chunk async for chunk in ops.read_stream("/value.bin", chunk_size=0)]
 
 
 @pytest.mark.asyncio
+@pytest.mark.xdist_group(name="prepopulated_layers")
 class TestFileManagerFallthrough:
     """Test fallthrough behavior with base filesystem."""
 
-    async def test_read_from_overlay_first(self, agent_fs, stable_fs):
+    async def test_read_from_overlay_first(self, prepopulated_ops):
         """Should read from overlay if file exists there."""
-        # Write to both layers
-        await stable_fs.fs.write_file("/test.txt", "base content")
-        await agent_fs.fs.write_file("/test.txt", "overlay content")
-
-        ops = FileManager(agent_fs, base_fs=stable_fs)
-        content = await ops.read("/test.txt")
+        content = await prepopulated_ops.read("/test.txt")
 
         # Should get overlay version
         assert content == "overlay content"
 
-    async def test_read_fallthrough_to_base(self, agent_fs, stable_fs):
+    async def test_read_fallthrough_to_base(self, prepopulated_ops):
         """Should fall through to base if file not in overlay."""
-        await stable_fs.fs.write_file("/base-only.txt", "base content")
-
-        ops = FileManager(agent_fs, base_fs=stable_fs)
-        content = await ops.read("/base-only.txt")
+        content = await prepopulated_ops.read("/base-only.txt")
 
         assert content == "base content"
 
-    async def test_read_not_found_in_either(self, agent_fs, stable_fs):
+    async def test_read_not_found_in_either(self, prepopulated_ops):
         """Should raise FileNotFoundError if file in neither layer."""
-        ops = FileManager(agent_fs, base_fs=stable_fs)
-
         with pytest.raises(FileNotFoundError) as exc_info:
-            await ops.read("/nonexistent.txt")
+            await prepopulated_ops.read("/nonexistent.txt")
 
         assert exc_info.value.path == "/nonexistent.txt"
         assert exc_info.value.cause is not None
 
-    async def test_write_only_to_overlay(self, agent_fs, stable_fs):
+    async def test_write_only_to_overlay(self, agent_fs, stable_fs, layered_ops):
         """Write should only affect overlay, not base."""
-        ops = FileManager(agent_fs, base_fs=stable_fs)
-
-        await ops.write("/new-file.txt", "overlay content")
+        await layered_ops.write("/new-file.txt", "overlay content")
 
         # Should exist in overlay
         overlay_content = await agent_fs.fs.read_file("/new-file.txt")
         assert overlay_content == "overlay content"
 
         # Should not exist in base
-        stable_ops = FileManager(stable_fs)
-        with pytest.raises(FileNotFoundError) as exc_info:
-            await stable_ops.read("/new-file.txt")
+        with pytest.raises(ErrnoException) as exc_info:
+            await stable_fs.fs.read_file("/new-file.txt")
 
-        assert exc_info.value.path == "/new-file.txt"
+        assert exc_info.value.code == "ENOENT"
 
-    async def test_file_exists_checks_both_layers(self, agent_fs, stable_fs):
+    async def test_file_exists_checks_both_layers(self, prepopulated_ops):
         """file_exists should check both layers."""
-        await stable_fs.fs.write_file("/base.txt", "base")
-        await agent_fs.fs.write_file("/overlay.txt", "overlay")
-
-        ops = FileManager(agent_fs, base_fs=stable_fs)
+        present = await asyncio.gather(
+            prepopulated_ops.exists("/base.txt"),
+            prepopulated_ops.exists("/overlay.txt"),
+            prepopulated_ops.exists("/nonexistent.txt"),
+        )
 
-        assert await ops.exists("/base.txt") is True
-        assert await ops.exists("/overlay.txt") is True
-        assert await ops.exists("/nonexistent.txt") is False
+        assert present == [True, True, False]
 
-    async def test_stat_fallthrough(self, agent_fs, stable_fs):
+    async def test_stat_fallthrough(self, prepopulated_ops):
         """stat should fall through to base."""
-        await stable_fs.fs.write_file("/base.txt", "base content")
+        stats = await prepopulated_ops.stat("/base.txt")
 
-        ops = FileManager(agent_fs, base_fs=stable_fs)
-        stats = await ops.stat("/base.txt")
+        assert stats.size == len(_BASE_BYTES)
 
-        assert stats.size == len(b"base content")
-
-    async def test_stat_overlay_first(self, agent_fs, stable_fs):
+    async def test_stat_overlay_first(self, prepopulated_ops):
         """stat should prefer overlay version."""
-        await stable_fs.fs.write_file("/file.txt", "short")
-        await agent_fs.fs.write_file("/file.txt", "much longer content")
-
-        ops = FileManager(agent_fs, base_fs=stable_fs)
-        stats = await ops.stat("/file.txt")
+        stats = await prepopulated_ops.stat("/file.txt")
 
         # Should get overlay size
-        assert stats.size == len(b"much longer content")
+        assert stats.size == len(_OVERLAY_BYTES)
 
 
 @pytest.mark.asyncio
 class TestFileManagerEdgeCases:
     """Test edge cases and error conditions."""
 
-    async def test_empty_file(self, agent_fs):
+    async def test_empty_file(self, ops):
         """Should handle empty files."""
-        ops = FileManager(agent_fs)
-
         await ops.write("/empty.txt", "")
         content = await ops.read("/empty.txt")
 
         assert content == ""
         assert await ops.exists("/empty.txt")
 
-    async def test_large_file(self, agent_fs):
+    @pytest.mark.slow
+    async def test_large_file(self, ops, large_bytes):
         """Should handle large files."""
-        ops = FileManager(agent_fs)
+        await ops.write("/large.bin", large_bytes)
 
-        large_content = "x" * (1024 * 1024)  # 1MB
-        await ops.write("/large.txt", large_content)
+        content = await ops.read("/large.bin", mode="binary")
+        assert content == large_bytes
 
-        content = await ops.read("/large.txt")
-        assert len(content) == len(large_content)
-
-    async def test_deep_directory_structure(self, agent_fs):
+    @pytest.mark.slow
+    async def test_deep_directory_structure(self, ops):
         """Should handle deeply nested paths."""
-        ops = FileManager(agent_fs)
-
         deep_path = "/a/b/c/d/e/f/g/h/i/j/file.txt"
         await ops.write(deep_path, "deep content")
 
         content = await ops.read(deep_path)
         assert content == "deep content"
 
-    async def test_special_characters_in_filename(self, agent_fs):
+    @pytest.mark.parametrize(
+        "path",
+        ["/file-with-dash.txt", "/file_with_underscore.txt", "/file.multiple.dots.txt"],
+    )
+    async def test_special_characters_in_filename(self, ops, path):
         """Should handle special characters in filenames."""
-        ops = FileManager(agent_fs)
-
-        special_files = [
-            "/file-with-dash.txt",
-            "/file_with_underscore.txt",
-            "/file.multiple.dots.txt",
-        ]
-
-        for path in special_files:
-            await ops.write(path, f"content for {path}")
-            content = await ops.read(path)
-            assert content == f"content for {path}"
+        expected = f"content for {path}"
+        await ops.write(path, expected)
 
-    async def test_unicode_content(self, agent_fs):
-        """Should handle Unicode content correctly."""
-        ops = FileManager(agent_fs)
+        assert await ops.read(path) == expected
 
-        unicode_content = "Hello 世界 🌍 مرحبا мир"
-        await ops.write("/unicode.txt", unicode_content)
+    async def test_list_dir_empty_directory(self, agent_fs, ops):
+        """Should handle empty directories."""
+        await agent_fs.fs.mkdir("/emptydir")
 
-        content = await ops.read("/unicode.txt")
-        assert content == unicode_content
+        assert await ops.list_dir("/emptydir") == []
 
-    async def test_list_dir_empty_directory(self, agent_fs):
-        """Should handle empty directories."""
-        ops = FileManager(agent_fs)
-
-        # Create directory by writing a file, then removing it
-        await ops.write("/emptydir/temp.txt", "temp")
-        await ops.remove("/emptydir/temp.txt")
-
-        # Directory listing might be empty or directory might not exist
-        # depending on AgentFS behavior
-        try:
-            entries = await ops.list_dir("/emptydir")
-            assert len(entries) == 0
-        except Exception:
-            # Empty directories might not exist in AgentFS
-            pass
-
-    async def test_tree_empty_filesystem(self, agent_fs):
+    async def test_tree_empty_filesystem(self, ops):
         """Should handle empty filesystem."""
-        ops = FileManager(agent_fs)
-
         tree = await ops.tree("/")
-        assert tree == {"name": "/", "path": "/", "type": "directory", "children": []}
+        assert tree == _EMPTY_TREE
 
-    async def test_search_files_no_matches(self, agent_fs):
+    async def test_search_files_no_matches(self, ops):
         """Should return empty list when no matches."""
-        ops = FileManager(agent_fs)
-
         await ops.write("/file.txt", "content")
 
         # Search for non-existent pattern
         files = await ops.search("*.py")
         assert files == []
 
-    async def test_overwrite_file(self, agent_fs):
+    async def test_overwrite_file(self, ops):
         """Should overwrite existing files."""
-        ops = FileManager(agent_fs)
-
         await ops.write("/file.txt", "original")
         await ops.write("/file.txt", "updated")
 
         content = await ops.read("/file.txt")
         assert content == "updated"
 
-    async def test_binary_and_text_mixed(self, agent_fs):
+    async def test_binary_and_text_mixed(self, ops):
         """Should handle both binary and text files."""
-        ops = FileManager(agent_fs)
-
         # Write text
         await ops.write("/text.txt", "text content")
 
@@ -486,101 +425,88 @@ class TestFileManagerEdgeCases:
         await ops.write("/binary.dat", b"\x00\x01\x02")
 
         # Read both
-        text = await ops.read("/text.txt")
-        binary = await ops.read("/binary.dat", mode="binary")
+        text, binary = await asyncio.gather(ops.read("/text.txt"), ops.read("/binary.dat", mode="binary"))
 
         assert text == "text content"
         assert binary == b"\x00\x01\x02"
 
-    async def test_json_dict_roundtrip(self, agent_fs):
-        """Should serialize dict content as JSON with deterministic formatting."""
-        ops = FileManager(agent_fs)
-
-        payload = {"message": "こんにちは", "count": 2}
+    @pytest.mark.parametrize(
+        "payload,expected",
+        [(_DICT_PAYLOAD, _DICT_EXPECTED), (_LIST_PAYLOAD, _LIST_EXPECTED)],
+        ids=["dict", "list"],
+    )
+    async def test_json_roundtrip(self, ops, payload, expected):
+        """Should serialize dict and list content as JSON with deterministic formatting."""
         await ops.write("/payload.json", payload)
 
         content = await ops.read("/payload.json")
-        assert content == '{\n  "message": "こんにちは",\n  "count": 2\n}'
-
-    async def test_json_list_roundtrip(self, agent_fs):
-        """Should serialize list content as JSON with deterministic formatting."""
-        ops = FileManager(agent_fs)
-
-        payload = ["α", "β", 3]
-        await ops.write("/items.json", payload)
-
-        content = await ops.read("/items.json")
-        assert content == '[\n  "α",\n  "β",\n  3\n]'
-
-    async def test_mode_type_mismatch_validation(self, agent_fs):
+        assert content == expected
+
+    @pytest.mark.parametrize(
+        "mode,content,match",
+        [
+            ("binary", "not-bytes", _RE_BINARY_MODE),
+            ("text", b"not-text", _RE_TEXT_MODE),
+            ("json", "not-json", _RE_JSON_MODE),
+        ],
+        ids=["binary", "text", "json"],
+    )
+    async def test_mode_type_mismatch_validation(self, ops, mode, content, match):
         """Should raise predictable errors when mode and content type do not match."""
-        ops = FileManager(agent_fs)
-
-        with pytest.raises(TypeError, match="mode='binary' requires bytes content"):
-            await ops.write("/bad.bin", "not-bytes", mode="binary")
-
-        with pytest.raises(TypeError, match="mode='text' requires str content"):
-            await ops.write("/bad.txt", b"not-text", mode="text")
-
-        with pytest.raises(TypeError, match="mode='json' requires dict or list content"):
-            await ops.write("/bad.json", "not-json", mode="json")
-
-    async def test_invalid_encoding_validation(self, agent_fs):
+        with pytest.raises(TypeError, match=match):
+            await ops.write(f"/bad.{mode}", content, mode=mode)
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda ops: ops.write("/bad-encoding.txt", "hello", encoding="definitely-not-an-encoding"),
+            lambda ops: ops.read("/hello.txt", encoding="definitely-not-an-encoding"),
+        ],
+        ids=["write", "read"],
+    )
+    async def test_invalid_encoding_validation(self, ops, call):
         """Should validate text encodings on read/write APIs."""
-        ops = FileManager(agent_fs)
-
-        with pytest.raises(ValueError, match="Unknown encoding"):
-            await ops.write("/bad-encoding.txt", "hello", encoding="definitely-not-an-encoding")
-
         await ops.write("/hello.txt", "hello")
-        with pytest.raises(ValueError, match="Unknown encoding"):
-            await ops.read("/hello.txt", encoding="definitely-not-an-encoding")
 
-    async def test_read_mode_encoding_mismatch_validation(self, agent_fs):
-        """Should reject incompatible read mode and encoding combinations."""
-        ops = FileManager(agent_fs)
+        with pytest.raises(ValueError, match=_RE_UNKNOWN_ENCODING):
+            await call(ops)
 
+    async def test_read_mode_encoding_mismatch_validation(self, ops):
+        """Should reject incompatible read mode and encoding combinations."""
         await ops.write("/hello.txt", "hello")
 
-        with pytest.raises(ValueError, match="encoding must be None when mode='binary'"):
+        with pytest.raises(ValueError, match=_RE_BINARY_ENCODING):
             await ops.read("/hello.txt", mode="binary", encoding="utf-8")
 
-        with pytest.raises(ValueError, match="encoding must be provided when mode='text'"):
+        with pytest.raises(ValueError, match=_RE_TEXT_ENCODING):
             await ops.read("/hello.txt", mode="text", encoding=None)
 
-    async def test_list_dir_on_file_raises_not_a_directory(self, agent_fs):
+    async def test_list_dir_on_file_raises_not_a_directory(self, ops):
         """Should raise NotADirectoryError when listing a file path."""
-        ops = FileManager(agent_fs)
-
         await ops.write("/plain.txt", "content")
 
         with pytest.raises(NotADirectoryError):
             await ops.list_dir("/plain.txt")
 
-    async def test_read_on_directory_raises_not_found(self, agent_fs):
+    async def test_read_on_directory_raises_not_found(self, ops):
         """Reading a directory should raise file-not-found from AgentFS semantics."""
-        ops = FileManager(agent_fs)
-
         await ops.write("/folder/file.txt", "content")
 
         with pytest.raises(FileNotFoundError):
             await ops.read("/folder")
 
-    async def test_remove_missing_path_raises_file_not_found(self, agent_fs):
+    async def test_remove_missing_path_raises_file_not_found(self, ops):
         """Removing a missing path should raise FileNotFoundError."""
-        ops = FileManager(agent_fs)
-
         with pytest.raises(FileNotFoundError):
             await ops.remove("/does-not-exist.txt")
 
-    async def test_stat_consistent_model_for_overlay_and_base(self, agent_fs, stable_fs):
+    async def test_stat_consistent_model_for_overlay_and_base(self, agent_fs, stable_fs, layered_ops):
         """stat() should return the same FileStats model from overlay and base fallthrough."""
         await stable_fs.fs.write_file("/base.txt", "base")
         await agent_fs.fs.write_file("/overlay.txt", "overlay")
 
-        ops = FileManager(agent_fs, base_fs=stable_fs)
-        overlay_stats = await ops.stat("/overlay.txt")
-        base_stats = await ops.stat("/base.txt")
+        overlay_stats = await layered_ops.stat("/overlay.txt")
+        base_stats = await layered_ops.stat("/base.txt")
 
         assert isinstance(overlay_stats, FileStats)
         assert isinstance(base_stats, FileStats)
@@ -591,35 +517,32 @@ class TestFileManagerEdgeCases:
 class TestFileManagerIntegration:
     """Integration tests for FileManager workflows."""
 
-    async def test_complete_workflow(self, agent_fs):
+    async def test_complete_workflow(self, ops):
         """Test complete file management workflow."""
-        ops = FileManager(agent_fs)
-
         # 1. Create files
-        await ops.write("/project/main.py", "print('main')")
-        await ops.write("/project/utils.py", "def helper(): pass")
-        await ops.write("/project/README.md", "# Project")
-
-        # 2. Search for Python files
-        py_files = await ops.search("*.py", recursive=True)
-        assert len(py_files) == 2
-
-        # 3. Check existence
-        assert await ops.exists("/project/main.py")
-        assert await ops.exists("/project/README.md")
+        write_result = await ops.write_many(
+            [
+                ("/project/main.py", "print('main')"),
+                ("/project/utils.py", "def helper(): pass"),
+                ("/project/README.md", "# Project"),
+            ],
+        )
+        assert all(item.ok for item in write_result.items)
+
+        # 2-5. Search, check existence, list and get tree (independent reads)
+        py_files, main_exists, readme_exists, entries, tree = await asyncio.gather(
+            ops.search("*.py", recursive=True),
+            ops.exists("/project/main.py"),
+            ops.exists("/project/README.md"),
+            ops.list_dir("/project"),
+            ops.tree("/project"),
+        )
 
-        # 4. Get directory listing
-        entries = await ops.list_dir("/project")
+        assert set(py_files) == {"/project/main.py", "/project/utils.py"}
+        assert main_exists and readme_exists
         assert len(entries) == 3
-
-        # 5. Get tree
-        tree = await ops.tree("/project")
         assert tree["type"] == "directory"
-        assert [child["name"] for child in tree["children"]] == [
-            "README.md",
-            "main.py",
-            "utils.py",
-        ]
+        assert _names(tree) == ["README.md", "main.py", "utils.py"]
 
         # 6. Remove a file
         await ops.remove("/project/utils.py")
@@ -627,36 +550,39 @@ class TestFileManagerIntegration:
 
         # 7. Verify final state
         py_files = await ops.search("*.py", recursive=True)
-        assert len(py_files) == 1
+        assert set(py_files) == {"/project/main.py"}
 
-    async def test_layered_workflow(self, agent_fs, stable_fs):
+    async def test_layered_workflow(self, stable_ops, layered_ops):
         """Test workflow with layered filesystems."""
         # Setup base layer
-        await stable_fs.fs.write_file("/config/default.json", '{"theme": "light"}')
-        await stable_fs.fs.write_file("/lib/core.py", "# Core library")
-
-        ops = FileManager(agent_fs, base_fs=stable_fs)
+        write_result = await stable_ops.write_many(
+            [
+                ("/config/default.json", '{"theme": "light"}'),
+                ("/lib/core.py", "# Core library"),
+            ],
+        )
+        assert all(item.ok for item in write_result.items)
 
         # 1. Read from base
-        config = await ops.read("/config/default.json")
+        config = await layered_ops.read("/config/default.json")
         assert "light" in config
 
         # 2. Override in overlay
-        await ops.write("/config/default.json", '{"theme": "dark"}')
+        await layered_ops.write("/config/default.json", '{"theme": "dark"}')
 
         # 3. Read overlay version
-        config = await ops.read("/config/default.json")
+        config = await layered_ops.read("/config/default.json")
         assert "dark" in config
 
         # 4. Add overlay-only file
-        await ops.write("/config/user.json", '{"name": "user"}')
+        await layered_ops.write("/config/user.json", '{"name": "user"}')
 
         # 5. Search across both layers
-        json_files = await ops.search("*.json", recursive=True)
-        assert len(json_files) >= 2
+        json_files = await layered_ops.search("*.json", recursive=True)
+        assert set(json_files) == {"/config/default.json", "/config/user.json"}
 
         # 6. Verify base unchanged
-        base_config = await stable_fs.fs.read_file("/config/default.json")
+        base_config = await stable_ops.read("/config/default.json")
         assert "light" in base_config
 
 
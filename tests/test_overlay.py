@@ -1,8 +1,10 @@
 """Tests for OverlayOperations and overlay merging."""
 
+import asyncio
+
 import pytest
 
-from fsdantic import FileNotFoundError, FileOperations, MergeStrategy, OverlayOperations
+from fsdantic import FileNotFoundError, MergeStrategy, OverlayOperations
 
 
 @pytest.mark.asyncio
@@ -28,30 +30,29 @@ class TestOverlayOperationsMerge:
         await agent_fs.fs.write_file("/a/b/c/deep.txt", "deep")
 
         ops = OverlayOperations()
-        result = await ops.merge(agent_fs, stable_fs)
+        await ops.merge(agent_fs, stable_fs)
 
         content = await stable_fs.fs.read_file("/a/b/c/deep.txt")
         assert content == "deep"
 
-    async def test_merge_with_specific_path(self, agent_fs, stable_fs):
+    async def test_merge_with_specific_path(self, agent_fs, stable_fs, stable_ops):
         """Should merge only specified path."""
         await agent_fs.fs.write_file("/include/file.txt", "include")
         await agent_fs.fs.write_file("/exclude/file.txt", "exclude")
 
         ops = OverlayOperations()
-        result = await ops.merge(agent_fs, stable_fs, path="/include")
+        await ops.merge(agent_fs, stable_fs, path="/include")
 
         # Should have merged /include
         assert await stable_fs.fs.read_file("/include/file.txt") == "include"
 
         # /exclude should not exist
-        stable_ops = FileOperations(stable_fs)
         with pytest.raises(FileNotFoundError) as exc_info:
-            await stable_ops.read_file("/exclude/file.txt")
+            await stable_ops.read("/exclude/file.txt")
 
         assert exc_info.value.path == "/exclude/file.txt"
 
-    async def test_merge_with_specific_file_path(self, agent_fs, stable_fs):
+    async def test_merge_with_specific_file_path(self, agent_fs, stable_fs, stable_ops):
         """Should merge exactly one file when path points to a file."""
         await stable_fs.fs.write_file("/single-file", "target content")
         await agent_fs.fs.write_file("/single-file", "source content")
@@ -67,9 +68,8 @@ class TestOverlayOperationsMerge:
         assert result.errors == []
         assert await stable_fs.fs.read_file("/single-file") == "target content"
 
-        stable_ops = FileOperations(stable_fs)
         with pytest.raises(FileNotFoundError) as exc_info:
-            await stable_ops.read_file("/other-file")
+            await stable_ops.read("/other-file")
 
         assert exc_info.value.path == "/other-file"
 
@@ -94,12 +94,29 @@ class TestMergeStrategies:
         await agent_fs.fs.write_file("/conflict.txt", "source content")
 
         ops = OverlayOperations(strategy=MergeStrategy.OVERWRITE)
-        result = await ops.merge(agent_fs, stable_fs)
+        await ops.merge(agent_fs, stable_fs)
 
         # Source should win
         content = await stable_fs.fs.read_file("/conflict.txt")
         assert content == "source content"
 
+    async def test_strategy_overwrite_skips_target_reads(self, agent_fs, stable_fs, monkeypatch):
+        """OVERWRITE strategy should not read target files it will replace."""
+        await stable_fs.fs.write_file("/conflict.txt", "target content")
+        await agent_fs.fs.write_file("/conflict.txt", "source content")
+
+        async def fail_read(*args, **kwargs):
+            raise AssertionError("target read during OVERWRITE merge")
+
+        monkeypatch.setattr(stable_fs.fs, "read_file", fail_read)
+
+        ops = OverlayOperations(strategy=MergeStrategy.OVERWRITE)
+        result = await ops.merge(agent_fs, stable_fs)
+
+        assert result.files_merged == 1
+        assert result.conflicts == []
+        assert result.errors == []
+
     async def test_strategy_preserve(self, agent_fs, stable_fs):
         """PRESERVE strategy should keep target content."""
         await stable_fs.fs.write_file("/conflict.txt", "target content")
@@ -138,7 +155,7 @@ class TestMergeStrategies:
 
         resolver = MergeResolver()
         ops = OverlayOperations(strategy=MergeStrategy.CALLBACK, conflict_resolver=resolver)
-        result = await ops.merge(agent_fs, stable_fs)
+        await ops.merge(agent_fs, stable_fs)
 
         # Should use resolver result
         content = await stable_fs.fs.read_file("/conflict.txt")
@@ -167,7 +184,7 @@ class TestMergeStrategies:
         ops = OverlayOperations(strategy=MergeStrategy.PRESERVE)
 
         # Override with OVERWRITE for this call
-        result = await ops.merge(agent_fs, stable_fs, strategy=MergeStrategy.OVERWRITE)
+        await ops.merge(agent_fs, stable_fs, strategy=MergeStrategy.OVERWRITE)
 
         # Should use OVERWRITE
         content = await stable_fs.fs.read_file("/file.txt")
@@ -210,6 +227,25 @@ class TestOverlayOperationsListChanges:
         # Should only list files under /include
         assert all(c.startswith("/include") for c in changes)
 
+    async def test_iter_changes_yields_bounded_batches_in_list_order(self, agent_fs):
+        """iter_changes should batch the same paths list_changes returns."""
+        for i in range(5):
+            await agent_fs.fs.write_file(f"/file{i}.txt", "content")
+        await agent_fs.fs.write_file("/dir/nested.txt", "content")
+
+        ops = OverlayOperations()
+        batches = [batch async for batch in ops.iter_changes(agent_fs, batch_size=2)]
+
+        assert [len(batch) for batch in batches] == [2, 2, 2]
+        assert [p for batch in batches for p in batch] == await ops.list_changes(agent_fs)
+
+    async def test_iter_changes_rejects_invalid_batch_size(self, agent_fs):
+        """iter_changes should reject non-positive batch sizes."""
+        ops = OverlayOperations()
+
+        with pytest.raises(ValueError, match="batch_size must be greater than 0"):
+            _ = [batch async for batch in ops.iter_changes(agent_fs, batch_size=0)]
+
 
 @pytest.mark.asyncio
 class TestOverlayOperationsReset:
@@ -275,6 +311,16 @@ class TestOverlayOperationsReset:
         # Should skip nonexistent path and remove existing path
         assert removed == 1
 
+    async def test_reset_skips_paths_removed_with_parent_directory(self, agent_fs):
+        """Should not count or fail on files already removed with their directory."""
+        await agent_fs.fs.write_file("/dir/file.txt", "content")
+
+        ops = OverlayOperations()
+        removed = await ops.reset_overlay(agent_fs, paths=["/dir", "/dir/file.txt"])
+
+        assert removed == 1
+        assert await ops.list_changes(agent_fs) == []
+
     async def test_reset_overlay_reports_errors(self, agent_fs):
         """Should raise with details when paths fail to reset."""
         ops = OverlayOperations()
@@ -355,22 +401,22 @@ class TestOverlayOperationsEdgeCases:
         await agent_fs.fs.write_file("/binary.dat", binary)
 
         ops = OverlayOperations()
-        result = await ops.merge(agent_fs, stable_fs)
+        await ops.merge(agent_fs, stable_fs)
 
         # Default read_file() returns text, so request bytes explicitly for binary assertions.
         merged_content = await stable_fs.fs.read_file("/binary.dat", encoding=None)
         assert merged_content == binary
 
-    async def test_merge_large_files(self, agent_fs, stable_fs):
+    async def test_merge_large_files(self, agent_fs, stable_fs, large_bytes):
         """Should handle large files."""
-        large = "x" * (1024 * 1024)  # 1MB
-        await agent_fs.fs.write_file("/large.txt", large)
+        await agent_fs.fs.write_file("/large.bin", large_bytes)
 
         ops = OverlayOperations()
         result = await ops.merge(agent_fs, stable_fs)
 
-        content = await stable_fs.fs.read_file("/large.txt")
-        assert len(content) == len(large)
+        assert result.files_merged == 1
+        content = await stable_fs.fs.read_file("/large.bin", encoding=None)
+        assert content == large_bytes
 
     async def test_merge_many_files(self, agent_fs, stable_fs):
         """Should handle merging many files."""
@@ -382,6 +428,31 @@ class TestOverlayOperationsEdgeCases:
         result = await ops.merge(agent_fs, stable_fs)
 
         assert result.files_merged == 100
+        merged = await asyncio.gather(*(stable_fs.fs.read_file(f"/file{i}.txt") for i in range(100)))
+        assert merged == [f"content{i}" for i in range(100)]
+
+    async def test_merge_read_ahead_failure_is_isolated(self, agent_fs, stable_fs, monkeypatch):
+        """A failed prefetched source read should only fail that file."""
+        for i in range(10):
+            await agent_fs.fs.write_file(f"/file{i}.txt", f"content{i}")
+        await agent_fs.fs.write_file("/sub/nested.txt", "nested")
+
+        original_read = agent_fs.fs.read_file
+
+        async def flaky_read(path, *args, **kwargs):
+            if path == "/file3.txt":
+                raise ValueError("read failed")
+            return await original_read(path, *args, **kwargs)
+
+        monkeypatch.setattr(agent_fs.fs, "read_file", flaky_read)
+
+        ops = OverlayOperations()
+        result = await ops.merge(agent_fs, stable_fs)
+
+        assert result.files_merged == 10
+        assert result.errors == [("/file3.txt", "read failed")]
+        assert await stable_fs.fs.read_file("/sub/nested.txt") == "nested"
+        assert await stable_fs.fs.read_file("/file9.txt") == "content9"
 
     async def test_merge_deep_nesting(self, agent_fs, stable_fs):
         """Should handle deeply nested paths."""
@@ -389,7 +460,7 @@ class TestOverlayOperationsEdgeCases:
         await agent_fs.fs.write_file(deep_path, "deep")
 
         ops = OverlayOperations()
-        result = await ops.merge(agent_fs, stable_fs)
+        await ops.merge(agent_fs, stable_fs)
 
         content = await stable_fs.fs.read_file(deep_path)
         assert content == "deep"
@@ -449,13 +520,13 @@ class TestOverlayOperationsIntegration:
         await agent_fs.fs.write_file("/config.json", '{"version": 2}')
 
         ops = OverlayOperations(strategy=MergeStrategy.OVERWRITE)
-        result = await ops.merge(agent_fs, stable_fs)
+        await ops.merge(agent_fs, stable_fs)
 
         # Should have merged with overwrite
         config = await stable_fs.fs.read_file("/config.json")
         assert '"version": 2' in config
 
-    async def test_selective_merge_with_reset(self, agent_fs, stable_fs):
+    async def test_selective_merge_with_reset(self, agent_fs, stable_fs, stable_ops):
         """Test merging some files and resetting others."""
         # Create multiple files
         await agent_fs.fs.write_file("/keep.txt", "keep")
@@ -472,8 +543,7 @@ class TestOverlayOperationsIntegration:
         # Stable should only have /keep.txt
         assert await stable_fs.fs.read_file("/keep.txt") == "keep"
 
-        stable_ops = FileOperations(stable_fs)
         with pytest.raises(FileNotFoundError) as exc_info:
-            await stable_ops.read_file("/discard.txt")
+            await stable_ops.read("/discard.txt")
 
         assert exc_info.value.path == "/discard.txt"
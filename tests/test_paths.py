@@ -20,6 +20,11 @@ class TestNormalizePath:
         normalized = normalize_path(raw_path)
         assert normalize_path(normalized) == normalized
 
+    def test_mixed_separator_runs_collapse_to_one_slash(self):
+        assert normalize_path("a\\/\\b") == "/a/b"
+        assert normalize_path("/a/\\//b", absolute=False) == "/a/b"
+        assert normalize_glob_pattern("src\\//*.py") == "src/*.py"
+
 
 class TestNormalizeGlobPattern:
     def test_normalize_glob_preserves_wildcards(self):
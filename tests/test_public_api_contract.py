@@ -6,10 +6,8 @@ AgentFS runtime integration.
 
 import fsdantic
 
-
-def test___all___exact_expected_exports() -> None:
-    """Top-level public API should match the intended contract exactly."""
-    expected_exports = {
+_EXPECTED_EXPORTS: frozenset[str] = frozenset(
+    {
         # Core models
         "Fsdantic",
         "Workspace",
@@ -69,9 +67,13 @@ def test___all___exact_expected_exports() -> None:
         "ValidationError",
         "ContentSearchError",
     }
+)
 
-    assert set(fsdantic.__all__) == expected_exports
-    assert len(fsdantic.__all__) == len(expected_exports)
+
+def test___all___exact_expected_exports() -> None:
+    """Top-level public API should match the intended contract exactly."""
+    assert frozenset(fsdantic.__all__) == _EXPECTED_EXPORTS
+    assert len(fsdantic.__all__) == len(_EXPECTED_EXPORTS)
 
 
 def test_workspace_first_top_level_import_smoke() -> None:
@@ -1,7 +1,9 @@
 """Tests for TypedKVRepository and NamespacedKVStore."""
 
+import asyncio
+
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from fsdantic import KVConflictError, KVRecord, TypedKVRepository, VersionedKVRecord, NamespacedKVStore
 from fsdantic.kv import KVManager
@@ -45,6 +47,16 @@ class TestTypedKVRepository:
         assert loaded.email == "alice@example.com"
         assert loaded.age == 30
 
+    async def test_load_without_validation(self, agent_fs):
+        """validate=False should construct trusted records without validating."""
+        repo = TypedKVRepository[UserRecord](agent_fs, prefix="user:")
+
+        await repo.save("alice", UserRecord(name="Alice", email="alice@example.com", age=30))
+
+        loaded = await repo.load("alice", UserRecord, validate=False)
+        assert loaded == UserRecord(name="Alice", email="alice@example.com", age=30)
+        assert await repo.load("missing", UserRecord, validate=False) is None
+
     async def test_load_nonexistent_returns_none(self, agent_fs):
         """Loading nonexistent record should return None."""
         repo = TypedKVRepository[UserRecord](agent_fs, prefix="user:")
@@ -101,8 +113,7 @@ class TestTypedKVRepository:
             ("charlie", UserRecord(name="Charlie", email="charlie@example.com", age=35)),
         ]
 
-        for user_id, user in users:
-            await repo.save(user_id, user)
+        await repo.save_many(users)
 
         # List all
         all_users = await repo.list_all(UserRecord)
@@ -116,9 +127,11 @@ class TestTypedKVRepository:
         repo = TypedKVRepository[UserRecord](agent_fs, prefix="user:")
 
         # Create records
-        await repo.save("user1", UserRecord(name="Alice", email="alice@example.com", age=30))
-        await repo.save("user2", UserRecord(name="Bob", email="bob@example.com", age=25))
-        await repo.save("user3", UserRecord(name="Charlie", email="charlie@example.com", age=35))
+        await repo.save_many([
+            ("user1", UserRecord(name="Alice", email="alice@example.com", age=30)),
+            ("user2", UserRecord(name="Bob", email="bob@example.com", age=25)),
+            ("user3", UserRecord(name="Charlie", email="charlie@example.com", age=35)),
+        ])
 
         # List IDs
         ids = await repo.list_ids()
@@ -132,8 +145,10 @@ class TestTypedKVRepository:
         configs_repo = TypedKVRepository[ConfigRecord](agent_fs, prefix="config:")
 
         # Create records in each
-        await users_repo.save("alice", UserRecord(name="Alice", email="alice@example.com", age=30))
-        await configs_repo.save("app", ConfigRecord(theme="dark", notifications=True))
+        await asyncio.gather(
+            users_repo.save("alice", UserRecord(name="Alice", email="alice@example.com", age=30)),
+            configs_repo.save("app", ConfigRecord(theme="dark", notifications=True)),
+        )
 
         # Each repo should only see its own records
         assert len(await users_repo.list_ids()) == 1
@@ -262,6 +277,19 @@ class TestTypedKVRepository:
         assert len(all_users) == 1
         assert all_users[0].name == "Alice"
 
+    async def test_unvalidated_reads_skip_non_mapping_records(self, agent_fs):
+        """validate=False should not construct models from non-mapping values."""
+        repo = TypedKVRepository[UserRecord](agent_fs, prefix="user:")
+
+        await repo.save("alice", UserRecord(name="Alice", email="alice@example.com", age=30))
+        await agent_fs.kv.set("user:corrupt", ["not", "a", "record"])
+
+        all_users = await repo.list_all(UserRecord, validate=False)
+        assert [user.name for user in all_users] == ["Alice"]
+
+        with pytest.raises(ValidationError):
+            await repo.load("corrupt", UserRecord, validate=False)
+
     async def test_empty_prefix(self, agent_fs):
         """Should work with empty prefix."""
         repo = TypedKVRepository[UserRecord](agent_fs, prefix="")
@@ -303,8 +331,10 @@ class TestManagerRepositoryEquivalents:
         manager = KVManager(agent_fs, prefix="app:")
         repo = manager.repository(prefix="user:", model_type=UserRecord)
 
-        await repo.save("alice", UserRecord(name="Alice", email="alice@example.com", age=30))
-        await repo.save("bob", UserRecord(name="Bob", email="bob@example.com", age=25))
+        await asyncio.gather(
+            repo.save("alice", UserRecord(name="Alice", email="alice@example.com", age=30)),
+            repo.save("bob", UserRecord(name="Bob", email="bob@example.com", age=25)),
+        )
 
         users = await repo.list_all()
         assert {user.name for user in users} == {"Alice", "Bob"}
@@ -337,12 +367,16 @@ class TestNamespacedKVStore:
         admins = kv.namespace("admin:")
 
         # Save to each
-        await users.save("alice", UserRecord(name="Alice", email="alice@example.com", age=30))
-        await admins.save("alice", UserRecord(name="Admin Alice", email="admin@example.com", age=40))
+        await asyncio.gather(
+            users.save("alice", UserRecord(name="Alice", email="alice@example.com", age=30)),
+            admins.save("alice", UserRecord(name="Admin Alice", email="admin@example.com", age=40)),
+        )
 
         # Load from each
-        user = await users.load("alice", UserRecord)
-        admin = await admins.load("alice", UserRecord)
+        user, admin = await asyncio.gather(
+            users.load("alice", UserRecord),
+            admins.load("alice", UserRecord),
+        )
 
         assert user.name == "Alice"
         assert admin.name == "Admin Alice"
@@ -356,9 +390,11 @@ class TestNamespacedKVStore:
         sessions = kv.namespace("session:")
 
         # Create records in each namespace
-        await users.save("u1", UserRecord(name="User1", email="u1@example.com", age=20))
-        await configs.save("c1", ConfigRecord(theme="light", notifications=False))
-        await sessions.save("s1", UserRecord(name="Session", email="s@example.com", age=25))
+        await asyncio.gather(
+            users.save("u1", UserRecord(name="User1", email="u1@example.com", age=20)),
+            configs.save("c1", ConfigRecord(theme="light", notifications=False)),
+            sessions.save("s1", UserRecord(name="Session", email="s@example.com", age=25)),
+        )
 
         # Verify isolation
         assert len(await users.list_ids()) == 1
@@ -420,13 +456,17 @@ class TestRepositoryEdgeCases:
         repo = TypedKVRepository[UserRecord](agent_fs, prefix="user:")
 
         # Create 100 records
-        for i in range(100):
-            user = UserRecord(name=f"User{i}", email=f"user{i}@example.com", age=20 + (i % 50))
-            await repo.save(f"user{i}", user)
+        save_result = await repo.save_many([
+            # Trusted fixture data: skip per-instance validation.
+            (f"user{i}", UserRecord.model_construct(name=f"User{i}", email=f"user{i}@example.com", age=20 + (i % 50)))
+            for i in range(100)
+        ])
+        assert all(item.ok for item in save_result.items)
 
-        # List all
-        all_users = await repo.list_all(UserRecord)
+        # List all (trusted round-trip data, so skip per-record validation)
+        all_users = await repo.list_all(UserRecord, validate=False)
         assert len(all_users) == 100
+        assert {user.name for user in all_users} == {f"User{i}" for i in range(100)}
 
         # List IDs
         all_ids = await repo.list_ids()
@@ -23,3 +23,20 @@ async def test_compare_streams_detects_equal_and_unequal():
     assert await compare_streams(_stream([b"ab", b"cd"]), _stream([b"ab", b"cd"])) is True
     assert await compare_streams(_stream([b"ab", b"cX"]), _stream([b"ab", b"cd"])) is False
     assert await compare_streams(_stream([b"ab"]), _stream([b"ab", b"cd"])) is False
+
+
+@pytest.mark.asyncio
+async def test_compare_streams_ignores_chunk_boundaries():
+    assert await compare_streams(_stream([b"abcd"]), _stream([b"ab", b"", b"cd"])) is True
+    assert await compare_streams(_stream([b"a", b"bcX"]), _stream([b"ab", b"cd"])) is False
+    assert await compare_streams(_stream([b"abc"]), _stream([b"ab", b"cd"])) is False
+
+
+@pytest.mark.asyncio
+async def test_compare_streams_with_misaligned_chunk_sizes():
+    payload = bytes(i % 251 for i in range(10_000))
+    left = [payload[i : i + 997] for i in range(0, len(payload), 997)]
+    right = [payload[i : i + 64] for i in range(0, len(payload), 64)]
+    changed = payload[:5_000] + b"\x00" + payload[5_001:]
+    assert await compare_streams(_stream(left), _stream(right)) is True
+    assert await compare_streams(_stream(left), _stream([changed])) is False
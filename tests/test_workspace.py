@@ -3,7 +3,7 @@
 import pytest
 from pydantic import ValidationError
 
-from fsdantic import AgentFSOptions, Fsdantic, Workspace
+from fsdantic import AgentFSOptions, Fsdantic, Workspace, client
 from fsdantic.client import SDKAgentFSOptions
 
 
@@ -18,17 +18,22 @@ class FakeAgentFS:
         self.closed_calls += 1
 
 
-@pytest.mark.asyncio
-class TestOpenBehavior:
-    async def test_open_by_id(self, monkeypatch):
-        captured = {}
+@pytest.fixture
+def captured(monkeypatch):
+    """Stub ``AgentFS.open`` and capture the SDK options it receives."""
+    captured = {}
+
+    async def fake_open(options):
+        captured["options"] = options
+        return FakeAgentFS()
 
-        async def fake_open(options):
-            captured["options"] = options
-            return FakeAgentFS()
+    monkeypatch.setattr(client.AgentFS, "open", fake_open)
+    return captured
 
-        monkeypatch.setattr("fsdantic.client.AgentFS.open", fake_open)
 
+@pytest.mark.asyncio
+class TestOpenBehavior:
+    async def test_open_by_id(self, captured):
         workspace = await Fsdantic.open(id="agent-123")
 
         assert isinstance(workspace, Workspace)
@@ -36,15 +41,7 @@ class TestOpenBehavior:
         assert captured["options"].id == "agent-123"
         assert captured["options"].path is None
 
-    async def test_open_by_path(self, monkeypatch, tmp_path):
-        captured = {}
-
-        async def fake_open(options):
-            captured["options"] = options
-            return FakeAgentFS()
-
-        monkeypatch.setattr("fsdantic.client.AgentFS.open", fake_open)
-
+    async def test_open_by_path(self, captured, tmp_path):
         workspace = await Fsdantic.open(path=str(tmp_path / "agent.db"))
 
         assert isinstance(workspace, Workspace)
@@ -67,17 +64,9 @@ class TestOpenBehavior:
             await Fsdantic.open(**kwargs)
 
         if message is not None:
-            assert message in str(exc_info.value)
-
-    async def test_open_with_options(self, monkeypatch, tmp_path):
-        captured = {}
-
-        async def fake_open(options):
-            captured["options"] = options
-            return FakeAgentFS()
-
-        monkeypatch.setattr("fsdantic.client.AgentFS.open", fake_open)
+            assert any(message in error["msg"] for error in exc_info.value.errors())
 
+    async def test_open_with_options(self, captured, tmp_path):
         options = AgentFSOptions(path=str(tmp_path / "agent.db"))
         workspace = await Fsdantic.open_with_options(options)
 
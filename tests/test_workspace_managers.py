@@ -1,5 +1,6 @@
 """Tests for workspace overlay/materialization manager APIs."""
 
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -64,9 +65,12 @@ class TestMaterializationManager:
         overlay = Workspace(agent_fs)
         base = Workspace(stable_fs)
 
-        await base.files.write("/base.txt", "base")
-        await overlay.files.write("/base.txt", "overlay")
-        await overlay.files.write("/new.txt", "new")
+        # Base and overlay are separate databases, so their writes can overlap.
+        _, write_result = await asyncio.gather(
+            base.files.write("/base.txt", "base"),
+            overlay.files.write_many([("/base.txt", "overlay"), ("/new.txt", "new")]),
+        )
+        assert all(item.ok for item in write_result.items)
 
         target = Path(temp_workspace_dir) / "materialized"
         result = await overlay.materialize.to_disk(target, base=base)